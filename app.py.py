@@ -4,6 +4,7 @@ import pandas as pd
 from PIL import Image, ImageDraw
 import random
 from scipy import stats
+from scipy.spatial import cKDTree
 import plotly.graph_objects as go
 
 # Configuration responsive
@@ -69,6 +70,207 @@ if 'net_position_prof' not in st.session_state:
 prop_sombres_superficiel = 0.55  # 55% de sombres en surface
 prop_sombres_profond = 0.45      # 45% de sombres en profondeur
 
+# Modes de simulation
+MODE_INFINI = "🌊 Lagon infini (tirages indépendants)"
+MODE_SPATIAL = "📍 Population spatiale (poissons positionnés)"
+MODE_FINI = "🔢 Population finie (pêche sans remise)"
+
+# Bornes (x_min, y_min, x_max, y_max) de chaque zone dans la vue du lagon
+zones_lagon = {
+    'superficiel': (0, 0, 500, 150),
+    'profond': (0, 150, 500, 300),
+}
+
+# Rayon des filets (en pixels de la vue du lagon)
+radius = 40
+
+if 'graine_population' not in st.session_state:
+    st.session_state.graine_population = random.randint(0, 2**31 - 1)
+# Générateur aléatoire de la session pour les populations spatiale et finie
+if 'rng' not in st.session_state:
+    st.session_state.rng = np.random.default_rng()
+
+
+def reinitialiser_echantillons():
+    """Vide les échantillons quand on change les conditions de la simulation."""
+    st.session_state.echantillons_superficiel = []
+    st.session_state.echantillons_profond = []
+    # Les populations finies sont remises à l'eau au complet
+    for zone in ('superficiel', 'profond'):
+        st.session_state.pop(f'restants_{zone}', None)
+        st.session_state.pop(f'sombres_initiaux_{zone}', None)
+    # Les populations spatiales seront reconstruites si besoin (jusqu'à 80 Mo par session)
+    st.session_state.pop('populations', None)
+
+
+def generer_population(zone, nb_poissons, repartition, prop_sombres, graine):
+    """Place les poissons d'une zone et construit l'arbre KD de leurs positions.
+
+    Renvoie (positions, sombres, arbre, petit_arbre) : les positions (x, y),
+    un booléen « sombre » par poisson, le cKDTree de tous les poissons et un
+    cKDTree des 20 000 premiers seulement. Les poissons étant placés dans un
+    ordre aléatoire, ce petit arbre suffit à tirer au hasard les poissons
+    sous un filet, sans parcourir les dizaines de milliers qui s'y trouvent.
+    """
+    rng = np.random.default_rng(graine)
+    x_min, y_min, x_max, y_max = zones_lagon[zone]
+    coin = np.array([x_min, y_min])
+    taille = np.array([x_max - x_min, y_max - y_min])
+
+    if repartition == "En bancs":
+        # Les poissons se regroupent en bancs, chacun avec sa propre proportion
+        # de sombres (loi bêta centrée sur la proportion de la zone)
+        nb_bancs = 30
+        centres = coin + rng.random((nb_bancs, 2)) * taille
+        props_bancs = rng.beta(4 * prop_sombres, 4 * (1 - prop_sombres), size=nb_bancs)
+        banc = rng.integers(nb_bancs, size=nb_poissons)
+        positions = centres[banc] + rng.normal(scale=15, size=(nb_poissons, 2))
+        # Les poissons qui sortiraient de la zone restent contre son bord
+        positions = np.clip(positions, coin, coin + taille)
+        sombres = rng.random(nb_poissons) < props_bancs[banc]
+    else:
+        positions = coin + rng.random((nb_poissons, 2)) * taille
+        sombres = rng.random(nb_poissons) < prop_sombres
+
+    return positions, sombres, cKDTree(positions), cKDTree(positions[:20_000])
+
+
+def obtenir_population(zone, nb_poissons, repartition, prop_sombres):
+    """Renvoie la population de la zone, construite une seule fois par session.
+
+    La population est gardée dans la session state (et non dans un cache partagé
+    entre élèves) : chaque session ne conserve que celle de ses réglages actuels,
+    soit environ 40 Mo par zone pour 1 000 000 de poissons.
+    """
+    cle = (zone, nb_poissons, repartition, st.session_state.graine_population)
+    populations = st.session_state.setdefault('populations', {})
+    if zone not in populations or populations[zone][0] != cle:
+        with st.spinner("🐟 Mise à l'eau des poissons..."):
+            populations[zone] = (cle, generer_population(
+                zone, nb_poissons, repartition, prop_sombres,
+                st.session_state.graine_population
+            ))
+    return populations[zone][1]
+
+
+def tirer_sans_remise(restants, nb_filets, rng, taille_filet=5):
+    """Tire nb_filets coups de filet successifs sans remise dans une population finie.
+
+    restants = [sombres, clairs] est mis à jour sur place. Un seul tirage
+    hypergéométrique donne le nombre de sombres parmi tous les poissons pêchés,
+    puis un tirage hypergéométrique multivarié les répartit entre les filets.
+    Renvoie la liste des (nb_sombres, nb_clairs) de chaque filet.
+    """
+    nb_sombres, nb_clairs = restants
+    # Les derniers filets peuvent revenir incomplets (ou vides) si la population s'épuise
+    deja_peches = taille_filet * np.arange(nb_filets)
+    tailles = np.clip(nb_sombres + nb_clairs - deja_peches, 0, taille_filet)
+    total = int(tailles.sum())
+    if total == 0:
+        return []
+
+    sombres_total = rng.hypergeometric(nb_sombres, nb_clairs, total)
+    sombres_filets = rng.multivariate_hypergeometric(tailles, sombres_total)
+    restants[0] -= int(sombres_total)
+    restants[1] -= total - int(sombres_total)
+    return [(int(s), int(t - s)) for s, t in zip(sombres_filets, tailles) if t > 0]
+
+
+def capturer_poissons(mode, zone, centre, prop_sombres, nb_poissons, repartition, radius, nb_filets):
+    """Donne la liste des (nb_sombres, nb_clairs) de chaque coup de filet de 5 poissons."""
+    if mode == MODE_FINI:
+        return tirer_sans_remise(
+            st.session_state[f'restants_{zone}'], nb_filets, st.session_state.rng
+        )
+
+    if mode == MODE_SPATIAL:
+        _, sombres, arbre, petit_arbre = obtenir_population(
+            zone, nb_poissons, repartition, prop_sombres
+        )
+        # Le filet attrape 5 poissons au hasard parmi tous ceux qui se trouvent sous lui :
+        # on cherche d'abord parmi les 20 000 premiers, tirés au hasard, puis dans toute
+        # la population si le filet y est trop peu rempli
+        sous_le_filet = petit_arbre.query_ball_point(centre, radius, return_sorted=False)
+        if len(sous_le_filet) < 5 and petit_arbre.n < arbre.n:
+            sous_le_filet = arbre.query_ball_point(centre, radius, return_sorted=False)
+        sous_le_filet = np.asarray(sous_le_filet, dtype=np.intp)
+        indices = st.session_state.rng.choice(
+            sous_le_filet, size=min(5, len(sous_le_filet)), replace=False
+        )
+        nb_sombres = int(sombres[indices].sum())
+        return [(nb_sombres, len(indices) - nb_sombres)]
+
+    nb_sombres = np.random.binomial(5, prop_sombres)
+    return [(nb_sombres, 5 - nb_sombres)]
+
+
+mode_simulation = st.radio(
+    "Mode de simulation :",
+    [MODE_INFINI, MODE_SPATIAL, MODE_FINI],
+    key="mode_simulation",
+    on_change=reinitialiser_echantillons,
+    help="En mode spatial, chaque zone contient de vrais poissons positionnés : le filet capture ceux qui se trouvent sous lui. "
+         "En population finie, les poissons pêchés ne sont pas remis à l'eau."
+)
+
+nb_poissons = None
+repartition = None
+nb_filets = 1
+
+if mode_simulation == MODE_SPATIAL:
+    col_nb, col_rep = st.columns(2)
+    with col_nb:
+        nb_poissons = st.select_slider(
+            "Nombre de poissons par zone :",
+            options=[1_000, 10_000, 100_000, 1_000_000],
+            value=100_000,
+            format_func=lambda n: f"{n:,}".replace(",", " "),
+            key="nb_poissons",
+            on_change=reinitialiser_echantillons
+        )
+    with col_rep:
+        repartition = st.radio(
+            "Répartition des poissons :",
+            ["Homogène", "En bancs"],
+            key="repartition",
+            on_change=reinitialiser_echantillons,
+            help="En bancs, les poissons sombres et clairs ne sont pas mélangés uniformément dans le lagon."
+        )
+
+    population_sup = obtenir_population(
+        'superficiel', nb_poissons, repartition, prop_sombres_superficiel
+    )
+    population_prof = obtenir_population(
+        'profond', nb_poissons, repartition, prop_sombres_profond
+    )
+
+if mode_simulation == MODE_FINI:
+    col_nb, col_filets = st.columns(2)
+    with col_nb:
+        nb_poissons = st.select_slider(
+            "Nombre de poissons par zone (N) :",
+            options=[50, 200, 1_000, 10_000, 1_000_000],
+            value=200,
+            format_func=lambda n: f"{n:,}".replace(",", " "),
+            key="nb_poissons_fini",
+            on_change=reinitialiser_echantillons
+        )
+    with col_filets:
+        nb_filets = st.select_slider(
+            "Coups de filet par clic :",
+            options=[1, 10, 50],
+            value=1,
+            key="nb_filets"
+        )
+
+    # Nombre initial de sombres et effectifs restants [sombres, clairs] de chaque zone
+    for zone, prop_sombres in (('superficiel', prop_sombres_superficiel),
+                               ('profond', prop_sombres_profond)):
+        if f'restants_{zone}' not in st.session_state:
+            sombres_initiaux = round(nb_poissons * prop_sombres)
+            st.session_state[f'sombres_initiaux_{zone}'] = sombres_initiaux
+            st.session_state[f'restants_{zone}'] = [sombres_initiaux, nb_poissons - sombres_initiaux]
+
 # Visualisation de l'étang avec deux zones
 st.write("**Vue du lagon avec les deux zones d'échantillonnage :**")
 
@@ -96,9 +298,14 @@ draw.line([boat_x+30, boat_y+5, boat_x+30, boat_y-15], fill='#654321', width=2)
 # Voile
 draw.polygon([(boat_x+30, boat_y-15), (boat_x+55, boat_y), (boat_x+30, boat_y+5)], fill='white', outline='gray')
 
+# En mode spatial, dessiner un aperçu des poissons (les premiers sont tirés au hasard)
+if mode_simulation == MODE_SPATIAL:
+    for positions, sombres, _, _ in (population_sup, population_prof):
+        for (x, y), sombre in zip(positions[:1500], sombres[:1500]):
+            draw.point((x, y), fill='#1F1F1F' if sombre else '#FFD966')
+
 # Filet circulaire dans la zone superficielle (position variable)
 center_x_sup, center_y_sup = st.session_state.net_position_sup
-radius = 40
 draw.ellipse([center_x_sup-radius, center_y_sup-radius, 
               center_x_sup+radius, center_y_sup+radius], 
              outline='orange', width=4)
@@ -139,29 +346,41 @@ with col_sup:
     st.markdown("### ⬆️ Eaux superficielles")
     st.write(f"On cherche la proportion de formes sombres🐟 / claires 🐠")
     
-    if st.button("🎣 Capturer 5 poissons", key="btn_superficiel", type="primary"):
-        nb_sombres = np.random.binomial(5, prop_sombres_superficiel)
-        nb_clairs = 5 - nb_sombres
-        st.session_state.echantillons_superficiel.append({
-            'numero': len(st.session_state.echantillons_superficiel) + 1,
-            'sombres': nb_sombres,
-            'clairs': nb_clairs,
-            'freq_sombres': nb_sombres / 5
-        })
+    if st.button(f"🎣 Capturer {5 * nb_filets} poissons", key="btn_superficiel", type="primary"):
         # Changer la position du filet aléatoirement
         st.session_state.net_position_sup = (
             random.randint(60, 440),
             random.randint(40, 120)
         )
+        captures = capturer_poissons(
+            mode_simulation, 'superficiel', st.session_state.net_position_sup,
+            prop_sombres_superficiel, nb_poissons, repartition, radius, nb_filets
+        )
+        for nb_sombres, nb_clairs in captures:
+            if nb_sombres + nb_clairs > 0:
+                st.session_state.echantillons_superficiel.append({
+                    'numero': len(st.session_state.echantillons_superficiel) + 1,
+                    'sombres': nb_sombres,
+                    'clairs': nb_clairs,
+                    'freq_sombres': nb_sombres / (nb_sombres + nb_clairs)
+                })
+        if mode_simulation == MODE_FINI and not captures:
+            st.toast("🪹 Population épuisée : tous les poissons de la zone ont été pêchés !")
+        elif not any(captures[0]):
+            st.toast("🕳️ Filet vide : aucun poisson à cet endroit !")
         st.rerun()
     
+    if mode_simulation == MODE_FINI:
+        restants = st.session_state.restants_superficiel
+        st.caption(f"Poissons restants dans la zone : {sum(restants)} / {nb_poissons}")
+
     if st.session_state.echantillons_superficiel:
         dernier = st.session_state.echantillons_superficiel[-1]
         st.write(f"**Échantillon #{dernier['numero']}**")
         
         # Visualisation des poissons en ligne
         poissons_html = "<div style='display: flex; gap: 5px; justify-content: center;'>"
-        for i in range(5):
+        for i in range(dernier['sombres'] + dernier['clairs']):
             if i < dernier['sombres']:
                 poissons_html += "<div style='font-size: 24px;'>🐟</div>"
             else:
@@ -193,29 +412,41 @@ with col_prof:
     st.markdown("### ⬇️ Eaux profondes")
     st.write(f"On cherche la proportion de formes sombres 🐟/claires 🐠")
     
-    if st.button("🎣 Capturer 5 poissons", key="btn_profond", type="primary"):
-        nb_sombres = np.random.binomial(5, prop_sombres_profond)
-        nb_clairs = 5 - nb_sombres
-        st.session_state.echantillons_profond.append({
-            'numero': len(st.session_state.echantillons_profond) + 1,
-            'sombres': nb_sombres,
-            'clairs': nb_clairs,
-            'freq_sombres': nb_sombres / 5
-        })
+    if st.button(f"🎣 Capturer {5 * nb_filets} poissons", key="btn_profond", type="primary"):
         # Changer la position du filet aléatoirement
         st.session_state.net_position_prof = (
             random.randint(60, 440),
             random.randint(190, 270)
         )
+        captures = capturer_poissons(
+            mode_simulation, 'profond', st.session_state.net_position_prof,
+            prop_sombres_profond, nb_poissons, repartition, radius, nb_filets
+        )
+        for nb_sombres, nb_clairs in captures:
+            if nb_sombres + nb_clairs > 0:
+                st.session_state.echantillons_profond.append({
+                    'numero': len(st.session_state.echantillons_profond) + 1,
+                    'sombres': nb_sombres,
+                    'clairs': nb_clairs,
+                    'freq_sombres': nb_sombres / (nb_sombres + nb_clairs)
+                })
+        if mode_simulation == MODE_FINI and not captures:
+            st.toast("🪹 Population épuisée : tous les poissons de la zone ont été pêchés !")
+        elif not any(captures[0]):
+            st.toast("🕳️ Filet vide : aucun poisson à cet endroit !")
         st.rerun()
     
+    if mode_simulation == MODE_FINI:
+        restants = st.session_state.restants_profond
+        st.caption(f"Poissons restants dans la zone : {sum(restants)} / {nb_poissons}")
+
     if st.session_state.echantillons_profond:
         dernier = st.session_state.echantillons_profond[-1]
         st.write(f"**Échantillon #{dernier['numero']}**")
         
         # Visualisation des poissons en ligne
         poissons_html = "<div style='display: flex; gap: 5px; justify-content: center;'>"
-        for i in range(5):
+        for i in range(dernier['sombres'] + dernier['clairs']):
             if i < dernier['sombres']:
                 poissons_html += "<div style='font-size: 24px;'>🐟</div>"
             else:
@@ -244,8 +475,9 @@ with col_prof:
 
 # Bouton de réinitialisation global
 if st.button("🔄 Tout réinitialiser"):
-    st.session_state.echantillons_superficiel = []
-    st.session_state.echantillons_profond = []
+    reinitialiser_echantillons()
+    # Nouvelle population de poissons pour le mode spatial
+    st.session_state.graine_population = random.randint(0, 2**31 - 1)
     st.rerun()
 
 # --- GRAPHIQUE D'ÉVOLUTION DE L'INTERVALLE DE CONFIANCE ---
@@ -267,31 +499,63 @@ if st.session_state.echantillons_superficiel or st.session_state.echantillons_pr
     total_echantillons = len(st.session_state.echantillons_superficiel) + len(st.session_state.echantillons_profond)
     
     # Bouton pour afficher les vraies proportions (seulement si > 60 captures)
+    revelation_possible = total_echantillons >= 60
+    condition_revelation = "60+ captures"
+    if mode_simulation == MODE_FINI:
+        # En population finie, 60 captures peuvent dépasser la population (N = 50) :
+        # on compte les poissons pêchés, sans exiger plus que N
+        seuil_poissons = min(60 * 5, nb_poissons)
+        nb_peches = sum(
+            nb_poissons - sum(st.session_state[f'restants_{zone}'])
+            for zone in ('superficiel', 'profond')
+        )
+        revelation_possible = nb_peches >= seuil_poissons
+        condition_revelation = f"{seuil_poissons}+ poissons pêchés"
     afficher_vraies_proportions = False
-    if total_echantillons >= 60:
+    if revelation_possible:
         afficher_vraies_proportions = st.checkbox(
-            "🔓 Révéler les vraies proportions (vous avez fait plus de 60 captures !)",
+            f"🔓 Révéler les vraies proportions (vous avez atteint {condition_revelation} !)",
             value=False,
             help="Les lignes pointillées montrent les vraies proportions dans la population"
         )
     
+    # Vraies proportions : en mode spatial, celles de la population générée
+    vraie_prop_sup, vraie_prop_prof = prop_sombres_superficiel, prop_sombres_profond
+    if mode_simulation == MODE_SPATIAL:
+        vraie_prop_sup = population_sup[1].mean()
+        vraie_prop_prof = population_prof[1].mean()
+    elif mode_simulation == MODE_FINI:
+        vraie_prop_sup = st.session_state.sombres_initiaux_superficiel / nb_poissons
+        vraie_prop_prof = st.session_state.sombres_initiaux_profond / nb_poissons
+
+    # En population finie, on peut comparer avec l'intervalle du lagon infini
+    comparer_infini = False
+    if mode_simulation == MODE_FINI:
+        comparer_infini = st.checkbox(
+            "🌊 Comparer avec l'intervalle sans correction (lagon infini)",
+            value=False,
+            help="Les lignes pointillées fines montrent l'intervalle calculé comme si la population était infinie"
+        )
+
     # Tracer les intervalles de confiance pour les eaux superficielles
     if st.session_state.echantillons_superficiel:
         df_sup = pd.DataFrame(st.session_state.echantillons_superficiel)
-        n_cumul_sup = []
-        ic_min_sup = []
-        ic_max_sup = []
-        f_values_sup = []
+        # Effectifs cumulés après chaque échantillon
+        cumul = df_sup[['sombres', 'clairs']].cumsum()
+        n_total = cumul['sombres'] + cumul['clairs']
+        f_moyen = cumul['sombres'] / n_total
+        marge_infini = 1.96 * np.sqrt((f_moyen * (1 - f_moyen)) / n_total)
+        marge = marge_infini
+        if mode_simulation == MODE_FINI:
+            # Correction de population finie : l'incertitude s'annule quand on a tout pêché
+            marge = marge_infini * np.sqrt((nb_poissons - n_total) / (nb_poissons - 1))
         
-        for i in range(len(df_sup)):
-            n_total = (i + 1) * 5
-            f_moyen = df_sup.loc[:i, 'freq_sombres'].mean()
-            marge = 1.96 * np.sqrt((f_moyen * (1 - f_moyen)) / n_total)
-            
-            n_cumul_sup.append(n_total)
-            f_values_sup.append(f_moyen)
-            ic_min_sup.append(f_moyen - marge)
-            ic_max_sup.append(f_moyen + marge)
+        n_cumul_sup = n_total.tolist()
+        f_values_sup = f_moyen.tolist()
+        ic_min_sup = (f_moyen - marge).tolist()
+        ic_max_sup = (f_moyen + marge).tolist()
+        ic_min_infini_sup = (f_moyen - marge_infini).tolist()
+        ic_max_infini_sup = (f_moyen + marge_infini).tolist()
         
         # Aire de confiance (remplissage)
         fig.add_trace(go.Scatter(
@@ -316,11 +580,25 @@ if st.session_state.echantillons_superficiel or st.session_state.echantillons_pr
             hovertemplate='n=%{x}<br>f=%{y:.2f}<extra></extra>'
         ))
         
+        # Bornes de l'intervalle sans correction (seulement si comparaison activée)
+        if comparer_infini:
+            for bornes in (ic_min_infini_sup, ic_max_infini_sup):
+                fig.add_trace(go.Scatter(
+                    x=n_cumul_sup,
+                    y=bornes,
+                    mode='lines',
+                    line=dict(color='#4682B4', width=1, dash='dot'),
+                    name='IC 95% sans correction Superficiel',
+                    legendgroup='infini_sup',
+                    showlegend=bornes is ic_min_infini_sup,
+                    hoverinfo='skip'
+                ))
+        
         # Ligne de la vraie proportion (seulement si bouton activé)
         if afficher_vraies_proportions:
             fig.add_trace(go.Scatter(
                 x=[0, max(n_cumul_sup)],
-                y=[prop_sombres_superficiel, prop_sombres_superficiel],
+                y=[vraie_prop_sup, vraie_prop_sup],
                 mode='lines',
                 line=dict(color='#4682B4', width=2, dash='dash'),
                 name='Vraie prop. Superficiel',
@@ -330,20 +608,22 @@ if st.session_state.echantillons_superficiel or st.session_state.echantillons_pr
     # Tracer les intervalles de confiance pour les eaux profondes
     if st.session_state.echantillons_profond:
         df_prof = pd.DataFrame(st.session_state.echantillons_profond)
-        n_cumul_prof = []
-        ic_min_prof = []
-        ic_max_prof = []
-        f_values_prof = []
+        # Effectifs cumulés après chaque échantillon
+        cumul = df_prof[['sombres', 'clairs']].cumsum()
+        n_total = cumul['sombres'] + cumul['clairs']
+        f_moyen = cumul['sombres'] / n_total
+        marge_infini = 1.96 * np.sqrt((f_moyen * (1 - f_moyen)) / n_total)
+        marge = marge_infini
+        if mode_simulation == MODE_FINI:
+            # Correction de population finie : l'incertitude s'annule quand on a tout pêché
+            marge = marge_infini * np.sqrt((nb_poissons - n_total) / (nb_poissons - 1))
         
-        for i in range(len(df_prof)):
-            n_total = (i + 1) * 5
-            f_moyen = df_prof.loc[:i, 'freq_sombres'].mean()
-            marge = 1.96 * np.sqrt((f_moyen * (1 - f_moyen)) / n_total)
-            
-            n_cumul_prof.append(n_total)
-            f_values_prof.append(f_moyen)
-            ic_min_prof.append(f_moyen - marge)
-            ic_max_prof.append(f_moyen + marge)
+        n_cumul_prof = n_total.tolist()
+        f_values_prof = f_moyen.tolist()
+        ic_min_prof = (f_moyen - marge).tolist()
+        ic_max_prof = (f_moyen + marge).tolist()
+        ic_min_infini_prof = (f_moyen - marge_infini).tolist()
+        ic_max_infini_prof = (f_moyen + marge_infini).tolist()
         
         # Aire de confiance (remplissage)
         fig.add_trace(go.Scatter(
@@ -368,11 +648,25 @@ if st.session_state.echantillons_superficiel or st.session_state.echantillons_pr
             hovertemplate='n=%{x}<br>f=%{y:.2f}<extra></extra>'
         ))
         
+        # Bornes de l'intervalle sans correction (seulement si comparaison activée)
+        if comparer_infini:
+            for bornes in (ic_min_infini_prof, ic_max_infini_prof):
+                fig.add_trace(go.Scatter(
+                    x=n_cumul_prof,
+                    y=bornes,
+                    mode='lines',
+                    line=dict(color='#1E3A8A', width=1, dash='dot'),
+                    name='IC 95% sans correction Profond',
+                    legendgroup='infini_prof',
+                    showlegend=bornes is ic_min_infini_prof,
+                    hoverinfo='skip'
+                ))
+        
         # Ligne de la vraie proportion (seulement si bouton activé)
         if afficher_vraies_proportions:
             fig.add_trace(go.Scatter(
                 x=[0, max(n_cumul_prof)],
-                y=[prop_sombres_profond, prop_sombres_profond],
+                y=[vraie_prop_prof, vraie_prop_prof],
                 mode='lines',
                 line=dict(color='#1E3A8A', width=2, dash='dash'),
                 name='Vraie prop. Profond',
@@ -400,24 +694,34 @@ if st.session_state.echantillons_superficiel or st.session_state.echantillons_pr
     st.plotly_chart(fig, use_container_width=True)
     
     if afficher_vraies_proportions:
-        st.info("""
+        st.info(f"""
         **📊 Graphique de confiance : Je suis toujours sûr à 95% mais avec un prix à payer 💰**
         
         - Les **zones colorées** représentent l'intervalle de confiance à 95%
         - La **ligne continue** montre la fréquence moyenne observée
-        - La **ligne pointillée** 🔓 indique la vraie proportion (révélée car vous avez fait 60+ captures !)
+        - La **ligne pointillée** 🔓 indique la vraie proportion (révélée car vous avez atteint {condition_revelation} !)
         - Plus vous échantillonnez (n augmente), plus l'intervalle **se resserre** autour de la vraie valeur
         - Le **prix à payer** 💰 : il faut capturer beaucoup de poissons pour être précis !
         """)
     else:
-        st.info("""
+        st.info(f"""
         **📊 Graphique de confiance : Je suis toujours sûr à 95% mais avec un prix à payer 💰**
         
         - Les **zones colorées** représentent l'intervalle de confiance à 95%
         - La **ligne continue** montre la fréquence moyenne observée
         - Plus vous échantillonnez (n augmente), plus l'intervalle **se resserre**
         - Le **prix à payer** 💰 : il faut capturer beaucoup de poissons pour être précis !
-        - 🔒 Continuez à échantillonner pour découvrir les vraies proportions (60+ captures nécessaires)
+        - 🔒 Continuez à échantillonner pour découvrir les vraies proportions ({condition_revelation} nécessaires)
+        """)
+
+    if mode_simulation == MODE_FINI:
+        st.info(f"""
+        **🔢 Population finie (N = {nb_poissons} poissons par zone)**
+
+        - Les poissons pêchés ne sont **pas remis à l'eau** : chaque capture apprend quelque chose de nouveau
+        - L'intervalle est multiplié par la **correction de population finie** √((N − n) / (N − 1))
+        - Quand on a pêché **toute la population** (n = N), il n'y a plus aucune incertitude !
+        - Avec un très grand N, la correction est négligeable : on retrouve le lagon infini
         """)
 
 st.divider()